@@ -3,30 +3,43 @@
 
 import argparse
 import re
+import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import cycle
+from operator import itemgetter
 from pathlib import Path
 from html import escape
-from typing import Iterable, List, Set, Tuple, Dict
+from typing import AbstractSet, Iterable, Iterator, List, Set, Tuple, Dict
 
-# --- Optional spaCy: use if model is present; fall back otherwise ---
-USE_SPACY = False
-nlp = None
-STOP_WORDS = set()
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.panel import Panel
+from rich.table import Table
+
+# --- Optional spaCy: use if present; fall back otherwise ---
+# By default spaCy runs as a blank tokenizer + lookup lemmatizer, which is much
+# faster than en_core_web_sm but has no POS tags. Set True to load the full
+# model and keep only VALID_POS terms.
+USE_FULL_MODEL = False
+STOP_WORDS = frozenset()
 
 try:
     import spacy
     from spacy.lang.en import stop_words as spacy_stop
 
-    STOP_WORDS = set(spacy_stop.STOP_WORDS)
-    try:
-        nlp = spacy.load("en_core_web_sm")
-        USE_SPACY = True
-    except Exception:
-        # Model not downloaded; fall back gracefully
-        USE_SPACY = False
+    STOP_WORDS = frozenset(spacy_stop.STOP_WORDS)
 except Exception:
     # spaCy not installed (unlikely, since you installed it) — still works without it
-    STOP_WORDS = set()
+    spacy = None
+
+# --- Optional pyahocorasick: match all phrases in one pass if present ---
+try:
+    import ahocorasick
+except Exception:
+    # Not installed; find_phrases falls back to one substring check per phrase
+    ahocorasick = None
 
 # --- Config ---
 VALID_POS = {"NOUN", "PROPN", "VERB", "ADJ"}
@@ -53,57 +66,120 @@ DEFAULT_NICE = [
     "algorithms",
 ]
 
+_CONSOLE = Console()
+
 PHRASE_SPLIT_RE = re.compile(r"[^\w\-/+\.]+")
+# Letters, digits and common dev symbols over already-lowercased text; symbols
+# only count when followed by another letter/digit, so tokens never end in
+# punctuation like "." or "/"
+TOKEN_RE = re.compile(r"[a-z](?:[a-z0-9]|[\-/+_.]+(?=[a-z0-9]))*")
 
 
 def read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="ignore")
-
-
-def tokenize_simple(text: str) -> List[str]:
-    # Simple tokenizer: letters, digits, common dev symbols; lowercased
-    raw = re.findall(r"[A-Za-z][A-Za-z0-9\-/+_.]{2,}", text)
-    toks = [t.lower() for t in raw]
-    # Strip punctuation-like endings
-    cleaned = [t.strip("._-+/") for t in toks]
-    # Filter stop words and too-short tokens
-    return [t for t in cleaned if len(t) >= MIN_LEN and t not in STOP_WORDS]
-
-
-def extract_terms(text: str) -> List[str]:
-    """Return a list of normalized 'terms' from text."""
-    if USE_SPACY and nlp is not None:
-        doc = nlp(text)
-        terms = []
-        for tok in doc:
-            if not tok.is_alpha:
-                continue
-            if tok.is_stop:
-                continue
-            if len(tok.lemma_) < MIN_LEN:
-                continue
-            if tok.pos_ not in VALID_POS:
-                continue
-            terms.append(tok.lemma_.lower())
-        return terms
+    # One read + one decode; skips TextIOWrapper's incremental decoding and
+    # newline translation, which nothing downstream depends on
+    return path.read_bytes().decode("utf-8", "ignore")
+
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the spaCy pipeline once per process; None if it is unavailable."""
+    if spacy is None:
+        return None
+    try:
+        if USE_FULL_MODEL:
+            # Only the tagger, attribute_ruler and lemmatizer feed pos_/lemma_
+            nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
+        else:
+            # Lookup tables come from the spacy-lookups-data package
+            nlp = spacy.blank("en")
+            nlp.add_pipe("lemmatizer", config={"mode": "lookup"})
+            nlp.initialize()
+    except Exception:
+        # Model or lookup tables not installed; fall back gracefully
+        return None
+    return nlp
+
+
+def tokenize_simple(
+    text: str,
+    _stop_words: AbstractSet[str] = STOP_WORDS,
+    _min_len: int = MIN_LEN,
+    _token_re: "re.Pattern[str]" = TOKEN_RE,
+    _intern=sys.intern,
+) -> Iterator[str]:
+    # Simple tokenizer: lowercase the whole text once, then drop stop words and
+    # too-short tokens. Globals are bound as defaults so the per-token loop uses
+    # local lookups. Tokens are interned so the CV and JD counters share keys.
+    return (
+        _intern(t)
+        for t in _token_re.findall(text.lower())
+        if len(t) >= _min_len and t not in _stop_words
+    )
+
+
+def _doc_terms(doc) -> Iterator[str]:
+    """Yield normalized 'terms' from a spaCy Doc."""
+    use_pos = doc.has_annotation("POS")
+    for tok in doc:
+        if not tok.is_alpha:
+            continue
+        if tok.is_stop:
+            continue
+        if len(tok.lemma_) < MIN_LEN:
+            continue
+        if use_pos and tok.pos_ not in VALID_POS:
+            continue
+        yield sys.intern(tok.lemma_.lower())
+
+
+def extract_terms(text: str) -> Iterator[str]:
+    """Yield normalized 'terms' from text."""
+    nlp = _get_nlp()
+    if nlp is not None:
+        yield from _doc_terms(nlp(text))
+    else:
+        yield from tokenize_simple(text)
+
+
+def extract_terms_batch(texts: List[str]) -> Iterator[Iterator[str]]:
+    """Yield the terms of each text in order, running spaCy over all texts in one batch."""
+    nlp = _get_nlp()
+    if nlp is not None:
+        for doc in nlp.pipe(texts):
+            yield _doc_terms(doc)
     else:
-        return tokenize_simple(text)
+        for text in texts:
+            yield tokenize_simple(text)
 
 
-def find_phrases(text: str, phrases: Iterable[str]) -> Set[str]:
-    """Case-insensitive phrase detector for multi/single-word skills like 'CI/CD'."""
+def compile_phrases(phrases: Iterable[str]):
+    """Normalize phrases once and, with pyahocorasick, build a single automaton for them."""
+    norm = {p.strip().lower() for p in phrases}
+    norm.discard("")
+    if ahocorasick is None or not norm:
+        return frozenset(norm)
+    automaton = ahocorasick.Automaton()
+    for p in norm:
+        automaton.add_word(p, p)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_phrases(text: str, matcher) -> Set[str]:
+    """Case-insensitive phrase detector for multi/single-word skills like 'CI/CD'.
+
+    `matcher` comes from compile_phrases(), so it can be shared across texts.
+    """
     text_l = text.lower()
-    found = set()
-    for p in phrases:
-        p_norm = p.strip().lower()
-        if not p_norm:
-            continue
-        if p_norm in text_l:
-            found.add(p_norm)
-    return found
+    if isinstance(matcher, frozenset):
+        return {p for p in matcher if p in text_l}
+    return {p for _end, p in matcher.iter(text_l)}
 
 
-def compute_overlap_and_gaps(cv_terms: Set[str], jd_terms: Set[str]) -> Tuple[Set[str], Set[str]]:
+def compute_overlap_and_gaps(
+    cv_terms: AbstractSet[str], jd_terms: AbstractSet[str]
+) -> Tuple[Set[str], Set[str]]:
     overlap = cv_terms & jd_terms
     gaps = jd_terms - cv_terms
     return overlap, gaps
@@ -119,12 +195,15 @@ def score_terms(
     Return list of (term, score, freq) for gap terms, sorted by score desc.
     Score = frequency * (1 + bonus if in phrase hits)
     """
-    scored = []
-    for term in gaps:
-        freq = jd_counts.get(term, 1)
-        bonus = phrase_bonus if term in phrase_hits else 1.0
-        scored.append((term, freq * bonus, freq))
-    scored.sort(key=lambda x: (-x[1], -x[2], x[0]))
+    get = jd_counts.get  # bound once instead of an attribute lookup per term
+    scored = [
+        (term, (freq := get(term, 1)) * (phrase_bonus if term in phrase_hits else 1.0), freq)
+        for term in gaps
+    ]
+    # Two stable C-keyed sorts (term asc, then score/freq desc) instead of a
+    # tuple-building lambda per element; terms are unique, so order is the same
+    scored.sort(key=itemgetter(0))
+    scored.sort(key=itemgetter(1, 2), reverse=True)
     return scored
 
 
@@ -134,13 +213,7 @@ def make_cli_tables(
     total_jd_terms: int,
     total_cv_terms: int,
 ):
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-
-    console = Console()
-
-    console.print(Panel.fit(
+    _CONSOLE.print(Panel.fit(
         f"[bold]CV ↔ JD Keyword Match[/bold]\n"
         f"[green]Overlap terms:[/green] {len(overlap_sorted)}   "
         f"[red]Gaps:[/red] {len(gaps_scored)}   "
@@ -157,7 +230,7 @@ def make_cli_tables(
 
     for i, (term, score, freq) in enumerate(gaps_scored, start=1):
         gaps_tbl.add_row(str(i), term, str(freq), f"{score:.2f}")
-    console.print(gaps_tbl)
+    _CONSOLE.print(gaps_tbl)
 
     # Overlap table
     ov_tbl = Table(title="Overlap Terms (present on your CV)", show_lines=False)
@@ -167,7 +240,7 @@ def make_cli_tables(
 
     for i, (term, freq) in enumerate(overlap_sorted, start=1):
         ov_tbl.add_row(str(i), term, str(freq))
-    console.print(ov_tbl)
+    _CONSOLE.print(ov_tbl)
 
 
 def make_html_report(
@@ -177,16 +250,26 @@ def make_html_report(
     jd_phrases: Set[str],
     out_path: Path,
 ):
+    # Each piece is built with a list comprehension and joined once; "".join
+    # on a list is cheaper than on a generator
     def table_html(headers: List[str], rows: List[List[str]]) -> str:
-        thead = "".join(f"<th>{escape(h)}</th>" for h in headers)
-        trs = "".join("<tr>" + "".join(f"<td>{escape(str(c))}</td>" for c in r) + "</tr>" for r in rows)
+        thead = "".join([f"<th>{escape(h)}</th>" for h in headers])
+        trs = "".join(["<tr>" + "".join([f"<td>{escape(str(c))}</td>" for c in r]) + "</tr>" for r in rows])
         return f"<table border='1' cellpadding='6' cellspacing='0'><thead><tr>{thead}</tr></thead><tbody>{trs}</tbody></table>"
 
+    def badges_html(phrases: Set[str], cls: str) -> str:
+        return "".join([f"<span class='badge {cls}'>{escape(p)}</span>" for p in sorted(phrases)]) or "—"
+
     gaps_rows = [[str(i), term, str(freq), f"{score:.2f}"]
                  for i, (term, score, freq) in enumerate(gaps_scored, start=1)]
     ov_rows = [[str(i), term, str(freq)]
                for i, (term, freq) in enumerate(overlap_sorted, start=1)]
 
+    cv_badges = badges_html(cv_phrases, "green")
+    jd_badges = badges_html(jd_phrases, "red")
+    gaps_table = table_html(["#", "Term", "JD Freq", "Score"], gaps_rows)
+    ov_table = table_html(["#", "Term", "JD Freq"], ov_rows)
+
     html = f"""<!doctype html>
 <html>
 <head>
@@ -207,14 +290,14 @@ tr:nth-child(even) {{ background: #fafafa; }}
 <h1>CV ↔ JD Keyword Match</h1>
 
 <h2>Detected Phrases</h2>
-<p><strong>On CV:</strong> {"".join(f"<span class='badge green'>{escape(p)}</span>" for p in sorted(cv_phrases)) or "—"}</p>
-<p><strong>In JD:</strong> {"".join(f"<span class='badge red'>{escape(p)}</span>" for p in sorted(jd_phrases)) or "—"}</p>
+<p><strong>On CV:</strong> {cv_badges}</p>
+<p><strong>In JD:</strong> {jd_badges}</p>
 
 <h2>Top Missing Terms (Gaps)</h2>
-{table_html(["#", "Term", "JD Freq", "Score"], gaps_rows)}
+{gaps_table}
 
 <h2>Overlap Terms (present on your CV)</h2>
-{table_html(["#", "Term", "JD Freq"], ov_rows)}
+{ov_table}
 
 <p style="margin-top:2rem;color:#666">Generated by match.py</p>
 </body>
@@ -229,10 +312,7 @@ def suggest_bullets(missing_terms: List[str], max_bullets: int = 10) -> List[str
         "Used {term} to solve a real task (data cleaning, API, or CLI) and published code.",
         "Created a short tutorial README explaining how to apply {term}.",
     ]
-    bullets = []
-    for t in missing_terms[:max_bullets]:
-        bullets.append(templates[len(bullets) % len(templates)].format(term=t))
-    return bullets
+    return [tmpl.format(term=t) for t, tmpl in zip(missing_terms[:max_bullets], cycle(templates))]
 
 
 def main():
@@ -246,32 +326,28 @@ def main():
     parser.add_argument("-o", "--output", type=Path, default=Path("report.html"), help="Output report HTML path")
     args = parser.parse_args()
 
-    cv_text = read_text(args.cv)
-    jd_text = read_text(args.job)
-
-    # Term extraction
-    cv_terms_list = extract_terms(cv_text)
-    jd_terms_list = extract_terms(jd_text)
+    # Read both files concurrently; blocking file I/O releases the GIL
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        cv_text, jd_text = pool.map(read_text, [args.cv, args.job])
 
-    cv_counts = Counter(cv_terms_list)
-    jd_counts = Counter(jd_terms_list)
-
-    cv_terms = set(cv_counts.keys())
-    jd_terms = set(jd_counts.keys())
+    # Term extraction (streamed straight into the counters)
+    cv_counts, jd_counts = (Counter(terms) for terms in extract_terms_batch([cv_text, jd_text]))
 
     # Phrase lists
     phrases = DEFAULT_NICE[:]
     if args.nice and args.nice.exists():
         phrases = [p.strip() for p in read_text(args.nice).splitlines() if p.strip()]
 
-    cv_phrase_hits = find_phrases(cv_text, phrases)
-    jd_phrase_hits = find_phrases(jd_text, phrases)
+    phrase_matcher = compile_phrases(phrases)
+    cv_phrase_hits = find_phrases(cv_text, phrase_matcher)
+    jd_phrase_hits = find_phrases(jd_text, phrase_matcher)
 
     # Overlap & gaps
-    overlap, gaps = compute_overlap_and_gaps(cv_terms, jd_terms)
+    overlap, gaps = compute_overlap_and_gaps(cv_counts.keys(), jd_counts.keys())
 
     # Sort overlap by JD frequency desc
-    overlap_sorted = sorted(((t, jd_counts[t]) for t in overlap), key=lambda x: (-x[1], x[0]))
+    overlap_sorted = sorted(((t, jd_counts[t]) for t in overlap), key=itemgetter(0))
+    overlap_sorted.sort(key=itemgetter(1), reverse=True)
 
     # Score gaps by JD frequency (+ phrase bonus)
     gaps_scored_all = score_terms(gaps, jd_counts, jd_phrase_hits)
@@ -279,7 +355,7 @@ def main():
     overlap_sorted_top = overlap_sorted[: args.top]
 
     # CLI output
-    make_cli_tables(overlap_sorted_top, gaps_scored, len(jd_terms), len(cv_terms))
+    make_cli_tables(overlap_sorted_top, gaps_scored, len(jd_counts), len(cv_counts))
 
     # HTML report
     make_html_report(overlap_sorted, gaps_scored_all, cv_phrase_hits, jd_phrase_hits, args.output)
@@ -289,13 +365,8 @@ def main():
     bullets = suggest_bullets(missing_terms_ranked, max_bullets=10)
 
     if bullets:
-        from rich.console import Console
-        from rich.panel import Panel
-        from rich.markdown import Markdown
-
-        console = Console()
         md = "### Suggested CV bullets to address gaps\n" + "\n".join(f"- {b}" for b in bullets)
-        console.print(Panel.fit(Markdown(md), title="Suggestions"))
+        _CONSOLE.print(Panel.fit(Markdown(md), title="Suggestions"))
 
     # Finish line
     print(f"\nSaved HTML report to: {args.output.resolve()}")